@@ -1,9 +1,10 @@
-from typing import Any, TypeVar
-from weakref import WeakKeyDictionary
+from typing import Any, overload, Self
+from weakref import ref as weak_ref
 
-from .reactive import announce_dependency, DependencyCollection
+from .instance_dict import InstanceDict
+from .reactive import _dep_ctx, DependencyCollection
 from .reactive_property import ReactivePropertyMixin
-from .typed_property import Getter, GetterMixin, TClass, TValue
+from .typed_property import _UNSET, Getter, GetterMixin, TClass, TValue
 
 
 
@@ -15,13 +16,61 @@ class CachedPropertyMixin(ReactivePropertyMixin[TClass, TValue]):
     """
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
-        self._cache_values = WeakKeyDictionary[TClass, TValue]()
+        self._cache_values = InstanceDict[TClass, TValue]()
+        # Values whose derived dependencies changed, which may yet turn out
+        # the same; kept (with the dependencies to check) until next read.
+        self._stale_values = \
+            InstanceDict[TClass, tuple[TValue, DependencyCollection]]()
+        # The read path in `__get__` stands in for our own `_get` only;
+        # if a subclass overrides `_get`, reads go through it instead.
+        self._get_is_own = type(self)._get is CachedPropertyMixin._get
+
+    @overload
+    def __get__(self,
+        instance: None,
+        owner: type[TClass] | None = None
+    ) -> Self: ...
+
+    @overload
+    def __get__(self,
+        instance: Any,
+        owner: type[TClass] | None = None
+    ) -> TValue: ...
+
+    def __get__(self,
+        instance: TClass | None,
+        owner: type[TClass] | None = None
+    ) -> TValue | Self:
+        # Specialised read path: serve cache hits directly,
+        # saving the `_get` dispatch on the (very common) clean read.
+        if instance is None:
+            return self
+        if not self._get_is_own:
+            return self._get(instance)
+        value = self._cache_values.get(instance, _UNSET)
+        if value is _UNSET:
+            return self._get(instance)
+        self._announce(instance, value)
+        return value
 
     def _fire_notifier(self, instance: Any) -> None:
         # Hooks into the change notification pipeline,
         # clearing the cache first, before firing the notifier.
-        if instance in self._cache_values:
-            del self._cache_values[instance]
+        self._cache_values.pop(instance, None)
+        self._stale_values.pop(instance, None)
+        super()._fire_notifier(instance)
+
+    def _mark_stale(self,
+        instance: Any,
+        dependencies: DependencyCollection
+    ) -> None:
+        # Only derived dependencies changed: rather than recomputing now
+        # (possibly for nobody), keep the old value to check on next read.
+        value = self._cache_values.pop(instance, _UNSET)
+        if value is _UNSET:
+            return # Already stale or dirty; dependents were told then
+        self._stale_values[instance] = (value, dependencies)
+        # Skipping our own override, which would drop the stale value.
         super()._fire_notifier(instance)
 
     def _get(self,
@@ -29,10 +78,22 @@ class CachedPropertyMixin(ReactivePropertyMixin[TClass, TValue]):
     ) -> TValue:
         # Prefer cache; but announce dependency manually,
         # since we're bypassing ReactivePropertyMixin._get(...)
-        if instance in self._cache_values:
-            notifier = self._get_notifier(instance)
-            announce_dependency(notifier)
-            return self._cache_values[instance]
+        try:
+            value = self._cache_values[instance]
+        except KeyError:
+            pass
+        else:
+            self._announce(instance, value)
+            return value
+        # Early cutoff: if the derived dependencies came out the same,
+        # so does the stale value.
+        stale = self._stale_values.pop(instance, None)
+        if stale is not None:
+            value, dependencies = stale
+            if not dependencies.derived_dependencies_changed():
+                self._cache_values[instance] = value
+                self._announce(instance, value)
+                return value
         # Recompute, cache, return.
         value = super()._get(instance)
         self._cache_values[instance] = value
@@ -43,14 +104,16 @@ class CachedPropertyMixin(ReactivePropertyMixin[TClass, TValue]):
         value: TValue
     ) -> None:
         # Bypass quickly if possible.
-        if instance in self._cache_values:
-            if self._cache_values[instance] == value:
-                return
+        old_value = self._cache_values.get(instance, _UNSET)
+        if old_value is not _UNSET and old_value == value:
+            return
         # Update the cache
         self._cache_values[instance] = value
+        self._stale_values.pop(instance, None)
         # Manually fire the notifier,
-        # since we're bypassing ReactivePropertyMixin._set(...).
-        self._fire_notifier(instance)
+        # since we're bypassing ReactivePropertyMixin._set(...);
+        # skipping our own override, which would drop the new value.
+        super()._fire_notifier(instance)
 
 
 class ComputedValueMixin(
@@ -59,28 +122,69 @@ class ComputedValueMixin(
 ):
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
+        # Disposed along with their instance, releasing their bindings
+        # (and values read) rather than leaving that to the GC.
         self._computed_dependencies = \
-            WeakKeyDictionary[TClass, DependencyCollection]()
+            InstanceDict[TClass, DependencyCollection](
+                on_release=DependencyCollection.dispose)
 
     def _get_computed_dependencies(self,
         instance: Any
     ) -> DependencyCollection:
-        if instance not in self._computed_dependencies:
+        try:
+            return self._computed_dependencies[instance]
+        except KeyError:
             # Have the dependency collection fire our change notifier
             trigger = self._get_notifier_trigger(instance)
-            self._computed_dependencies[instance] = \
-                DependencyCollection(trigger)
+            # ...or, for derived dependencies, just mark us stale.
+            # Refers to the instance weakly, like `trigger`.
+            instance_ref = weak_ref(instance)
+            def mark_stale(_: None) -> None:
+                if (instance := instance_ref()) is not None:
+                    self._mark_stale(instance,
+                        self._computed_dependencies[instance])
+            deps = self._computed_dependencies[instance] = \
+                DependencyCollection(trigger, mark_stale)
             # ALSO have the dependency collection clear our cache
-        return self._computed_dependencies[instance]
+            return deps
+
+    def _mark_stale(self,
+        instance: Any,
+        dependencies: DependencyCollection
+    ) -> None:
+        """
+        Called when only derived dependencies have changed.
+        Without a cache to keep, this is just a change.
+        """
+        self._fire_notifier(instance)
+
+    def _announce(self, instance: Any, value: Any = None) -> None:
+        # Announce ourself as a derived dependency, with the value read,
+        # so dependents can re-check us before recomputing themselves.
+        frame = _dep_ctx.get()
+        if frame is None:
+            return
+        frame[self._get_notifier(instance)] = \
+            (self, weak_ref(instance), value)
 
     def _get(self,
         instance: Any
     ) -> TValue:
         deps = self._get_computed_dependencies(instance)
-        with deps.listen_for_dependencies():
-            # Call the getter more directly, so we don't just get our ourself
-            # as a dependency.
-            value = GetterMixin[TClass, TValue]._get(self, instance)
+        value = _UNSET
+        try:
+            with deps.listen_for_dependencies():
+                # Call the getter more directly, so we don't just get our
+                # ourself as a dependency.
+                value = GetterMixin[TClass, TValue]._get(self, instance)
+        finally:
+            # Announce ourself to any outer listener (e.g. a watcher),
+            # now that our own listening context has closed; failed reads
+            # too, but plainly, having no value to re-check.
+            if value is _UNSET:
+                ReactivePropertyMixin[TClass, TValue]._announce(self, instance)
+            else:
+                self._announce(instance, value)
         return value
 
 
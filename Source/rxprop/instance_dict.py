@@ -0,0 +1,106 @@
+from typing import Any, Callable, Generic, TypeVar, overload
+from weakref import finalize
+
+
+_TKey = TypeVar("_TKey")
+_TValue = TypeVar("_TValue")
+_TDefault = TypeVar("_TDefault")
+
+# Shared empty stand-in, swapped out for a real dict on first write.
+# Only ever read from (or popped from, which is a no-op when empty).
+_NO_DATA: dict[int, Any] = {}
+_MISSING: Any = object()
+
+# The tables holding an entry for each live key, by `id(key)`.
+# Shared by all tables, so each key needs just one finalizer,
+# however many descriptors stash something for it.
+_tables_by_key: dict[int, list['InstanceDict[Any, Any]']] = {}
+
+
+def _release_key(key_id: int) -> None:
+    for table in _tables_by_key.pop(key_id, ()):
+        table._release(key_id)
+
+
+class InstanceDict(Generic[_TKey, _TValue]):
+    """
+    A dictionary keyed by object identity,
+    whose entries are discarded when their key is garbage collected.
+
+    Like `WeakKeyDictionary`, but lookups are a plain `dict` probe on
+    `id(key)`; keys need not be hashable, and equal-but-distinct keys
+    never share an entry.
+    """
+    def __init__(self, on_release: Callable[[_TValue], None] | None = None):
+        # Allocated lazily: most descriptors' tables see few instances,
+        # and many never see any; reads need no check either way.
+        self._data: dict[int, _TValue] = _NO_DATA
+        # Called with an entry's value when its key is collected
+        self._on_release = on_release
+
+    def _track(self, key: _TKey, key_id: int) -> None:
+        """
+        Registers this table to drop its entry when the key dies,
+        before its id can be reused. The first table to see a key
+        registers the (one) finalizer for it.
+        """
+        tables = _tables_by_key.get(key_id)
+        if tables is None:
+            finalizer = finalize(key, _release_key, key_id)
+            finalizer.atexit = False
+            _tables_by_key[key_id] = [self]
+        elif self not in tables: # Short; one entry per table in use
+            tables.append(self)
+
+    def _release(self, key_id: int) -> None:
+        value = self._data.pop(key_id, _MISSING)
+        if value is not _MISSING and self._on_release is not None:
+            self._on_release(value)
+
+    def __contains__(self, key: _TKey) -> bool:
+        return id(key) in self._data
+
+    def __getitem__(self, key: _TKey) -> _TValue:
+        return self._data[id(key)]
+
+    def __setitem__(self, key: _TKey, value: _TValue) -> None:
+        key_id = id(key)
+        if key_id not in self._data: # Present entries are tracked already
+            self._track(key, key_id)
+            if self._data is _NO_DATA:
+                self._data = {}
+        self._data[key_id] = value
+
+    def __delitem__(self, key: _TKey) -> None:
+        del self._data[id(key)]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def get(self, key: _TKey) -> _TValue | None:
+        ...
+
+    @overload
+    def get(self, key: _TKey, default: _TDefault) -> _TValue | _TDefault:
+        ...
+
+    def get(self, key: _TKey, default: Any = None) -> Any:
+        """ Returns the value for `key`, or `default` if absent. """
+        return self._data.get(id(key), default)
+
+    @overload
+    def pop(self, key: _TKey) -> _TValue | None:
+        ...
+
+    @overload
+    def pop(self, key: _TKey, default: _TDefault) -> _TValue | _TDefault:
+        ...
+
+    def pop(self, key: _TKey, default: Any = None) -> Any:
+        """ Removes and returns the value for `key`, or `default` if absent. """
+        return self._data.pop(id(key), default)
+
+    def clear(self) -> None:
+        """ Removes all entries. """
+        self._data.clear()
@@ -1,4 +1,5 @@
 from types import TracebackType
+from typing import Any
 from weakref import finalize
 
 
@@ -8,9 +9,11 @@ class Disposable:
     Exposes automatic disposal via finalization (GC),
     and explicit disposal via `dispose()`.
     """
+    _finalizer: 'finalize[..., Any] | None' = None
+
     def __init__(self):
         self._is_disposed = False
-        finalize(self, self._dispose)
+        self._finalizer = finalize(self, self._dispose)
     
     def dispose(self):
         """ Explicitly disposes of this Lifetime object. """
@@ -19,6 +22,10 @@ class Disposable:
     def _dispose(self):
         """ Disposal logic. """
         self._is_disposed = True
+        # The finalizer refers back to us; drop it, so we can be collected
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
 
 
 class Lifetime(Disposable):
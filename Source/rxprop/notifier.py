@@ -1,5 +1,5 @@
-from typing import Callable, Generic, Protocol, TypeVar, runtime_checkable
-from weakref import WeakSet, ref as weak_ref
+from typing import Any, Callable, Generic, Protocol, TypeVar, runtime_checkable
+from weakref import ref as weak_ref
 
 from .lifetime import Lifetime
 
@@ -12,8 +12,29 @@ class Notifier(Generic[_TArgs]):
     """
     A source of notification events.
     """
+    # One notifier exists per (instance, reactive property) pair,
+    # so keep them small; `__weakref__` for bindings and dependency sets.
+    __slots__ = ('_bindings', '_on_collect', '__weakref__')
+
     def __init__(self):
-        self._bindings = WeakSet['Notifier[_TArgs]._BindingLifetime']()
+        # Weak references to live bindings, as an insertion-ordered set;
+        # each reference drops itself when its binding is collected.
+        self._bindings = dict[_BindingRef, None]()
+        self._on_collect: Callable[[_BindingRef], None] | None = None
+
+    def _get_on_collect(self) -> 'Callable[[_BindingRef], None]':
+        """
+        Returns the (shared) weakref callback for this notifier's bindings.
+        Created lazily, and only refers back to this notifier weakly.
+        """
+        on_collect: Callable[[_BindingRef], None] | None = self._on_collect
+        if on_collect is None:
+            self_ref = weak_ref(self)
+            def collect(binding_ref: _BindingRef) -> None:
+                if notifier := self_ref():
+                    notifier._bindings.pop(binding_ref, None)
+            on_collect = self._on_collect = collect
+        return on_collect
 
     class _BindingLifetime(Lifetime):
         """
@@ -26,7 +47,8 @@ class Notifier(Generic[_TArgs]):
         ):
             self._notifier = weak_ref(notifier)
             self.handler = handler
-            notifier._bindings.add(self)
+            self._ref: _BindingRef = weak_ref(self, notifier._get_on_collect())
+            notifier._bindings[self._ref] = None
 
         def unbind(self):
             """
@@ -35,7 +57,7 @@ class Notifier(Generic[_TArgs]):
             Robust to multiple calls.
             """
             if self._notifier and (notifier := self._notifier()):
-                notifier._bindings.remove(self)
+                notifier._bindings.pop(self._ref, None)
             self._notifier = None
             self.handler = None
 
@@ -55,17 +77,31 @@ class Notifier(Generic[_TArgs]):
         """
         return self._BindingLifetime(self, handler)
 
+    def has_bindings(self) -> bool:
+        """
+        Returns True if any handlers are currently bound to this notifier.
+        """
+        return bool(self._bindings)
+
     def fire(self, args: _TArgs) -> None:
         """
         Fires all handlers bound to this notifier.
         """
+        if not self._bindings:
+            return # Common for unobserved properties; skip the copy
         # Fire handlers carefully,
         # in case one of them messes with self._bindings
-        for binding in list(self._bindings):
-            if binding in self._bindings and binding.handler:
+        # (unbinding clears `handler`, so removed bindings are skipped)
+        for binding_ref in list(self._bindings):
+            binding = binding_ref()
+            if binding is not None and binding.handler:
                 binding.handler(args)
 
 
+# A weak reference to a binding, as keyed in `Notifier._bindings`
+_BindingRef = weak_ref[Notifier[Any]._BindingLifetime]
+
+
 @runtime_checkable
 class PChangeNotifier(Protocol):
     """
@@ -1,27 +1,62 @@
-from asyncio import Event, sleep
-from contextlib import contextmanager
-from typing import AsyncIterator, Callable, Iterator, TypeVar
-from weakref import WeakKeyDictionary
+from asyncio import Future, get_running_loop, sleep
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar
+from weakref import WeakKeyDictionary, ref as weak_ref
 
 from .notifier import Notifier
 from .lifetime import Lifetime
+from .typed_property import TypedProperty
 
 
 _SimpleNotifier = Notifier[None]
 _SimpleHandler = Callable[[None], None]
 _TValue = TypeVar("_TValue")
 
-_dep_ctx_stack: list[set[_SimpleNotifier]] = []
+# A read of a derived (e.g. computed) value: the property, the instance
+# (weakly) and the value read; enough to re-check it later on.
+_DerivedRead = tuple[TypedProperty[Any, Any], weak_ref[Any], object]
+_DependencyFrame = dict[_SimpleNotifier, _DerivedRead | None]
+
+# The innermost dependency tracking frame, or None if nobody is listening.
+# Each frame is an insertion-ordered set (dict keyed by notifier), so
+# repeated reads dedupe in O(1) and first-access order is kept;
+# values are `None`, except for reads of derived values.
+# Only reads in the innermost frame are tracked, so outer frames need
+# not be reachable: entering a listener saves the previous frame in
+# its reset token. A context variable, so each thread and each asyncio
+# task tracks its own reads.
+_dep_ctx = ContextVar[_DependencyFrame | None]('_dep_ctx', default=None)
+
+# Types whose values cannot change in place; for anything else, getting
+# the very same object back says nothing about whether it has changed.
+_IMMUTABLE_TYPES = frozenset[type]((
+    type(None), bool, int, float, complex, str, bytes,
+))
 
 
 class DependencyCollection(Lifetime):
     """
     Manages a collection of dependencies.
     """
-    def __init__(self, handler: _SimpleHandler):
+    def __init__(self,
+        handler: _SimpleHandler,
+        derived_handler: _SimpleHandler | None = None
+    ):
         super().__init__()
         self._bindings = WeakKeyDictionary[_SimpleNotifier, Lifetime]()
         self._handler: _SimpleHandler|None = handler
+        # Fired instead for derived dependencies, if given; their change
+        # may come to nothing (see `derived_dependencies_changed`).
+        self._derived_handler: _SimpleHandler|None = derived_handler or handler
+        # Frozen snapshot of the dependencies from the last clean run;
+        # None when stale (e.g. after manual add/remove or an exception).
+        # Weak, like `_bindings`, so dropped sources' notifiers can go.
+        self._dependencies: \
+            tuple[weak_ref[_SimpleNotifier], ...] | None = ()
+        # Derived values read in the last clean run
+        self._derived_reads: tuple[_DerivedRead, ...] = ()
 
     def add_dependency(self, notifier: _SimpleNotifier):
         """ Adds a dependency to this collection. """
@@ -30,37 +65,123 @@ class DependencyCollection(Lifetime):
         if not self._handler: return
         binding = notifier.bind(self._handler)
         self._bindings[notifier] = binding
+        self._dependencies = None
 
     def remove_dependency(self, notifier: _SimpleNotifier):
         """ Removes a dependency from this collection. """
         assert self.is_alive()
         self._bindings.pop(notifier)
+        self._dependencies = None
 
-    @contextmanager
-    def listen_for_dependencies(self) -> Iterator[None]:
+    def listen_for_dependencies(self) -> AbstractContextManager[None]:
         """
         Listens for dependencies in a context,
         and updates this collection accordingly.
         """
         assert self.is_alive()
-        buffer = set[_SimpleNotifier]()
-        _dep_ctx_stack.append(buffer)
+        return _DependencyListener(self)
+
+    def _update_dependencies(self,
+        buffer: _DependencyFrame,
+        succeeded: bool
+    ) -> None:
+        """
+        Rebinds this collection to the dependencies in `buffer`.
+        """
+        previous = self._dependencies
+        # (Live weak refs compare by referent, and plain ones are shared,
+        # so this is cheap after the first run.)
+        current = tuple(map(weak_ref, buffer))
+        # Kept even when the trace is unchanged; the values read may differ
+        self._derived_reads = \
+            tuple(filter(None, buffer.values())) if succeeded else ()
+        if succeeded and current == previous:
+            return # Same trace as last time; bindings are already right
+        if previous is None:
+            previous_deps = tuple(self._bindings.keys())
+        else:
+            # Dead ones have already dropped out of `_bindings`
+            previous_deps = tuple(
+                dep for ref in previous if (dep := ref()) is not None)
+        # Diff against `previous_deps` directly (identity-hashed lookups),
+        # rather than probing the weak bindings table once per dependency.
+        bindings = self._bindings
+        for dep in previous_deps:
+            if dep not in buffer:
+                bindings.pop(dep, None)
+        handler = self._handler
+        derived_handler = self._derived_handler
+        if handler is not None and derived_handler is not None:
+            bound = set(previous_deps)
+            for dep, derived in buffer.items():
+                if dep not in bound:
+                    bindings[dep] = dep.bind(
+                        handler if derived is None else derived_handler)
+        # Only a clean run yields a trustworthy dependency list
+        self._dependencies = current if succeeded else None
+
+    def derived_dependencies_changed(self) -> bool:
+        """
+        Re-reads the derived values read in the last clean run,
+        returning True if any of them now differs (or fails).
+        The same mutable object counts as changed; it may have been
+        changed in place.
+        Other dependencies are not checked: those fire `handler`,
+        which always means a change.
+        """
+        token = _dep_ctx.set(None) # Re-reads are not the caller's reads
         try:
-            yield
+            for property, instance_ref, seen in self._derived_reads:
+                instance = instance_ref()
+                if instance is None:
+                    return True
+                try:
+                    value = property.get(instance)
+                    if (value is not seen
+                            or type(value) in _IMMUTABLE_TYPES) \
+                            and value == seen:
+                        continue
+                except Exception:
+                    pass # Resurfaces when the dependent recomputes
+                return True
+            return False
         finally:
-            bindings = set(self._bindings.keys())
-            _dep_ctx_stack.pop()
-            for dep in buffer - bindings:
-                self.add_dependency(dep)
-            for dep in bindings - buffer:
-                self.remove_dependency(dep)
+            _dep_ctx.reset(token)
 
     def _dispose(self):
         self._bindings.clear()
+        self._dependencies = ()
+        self._derived_reads = ()
         self._handler = None
+        self._derived_handler = None
         super()._dispose()
 
 
+class _DependencyListener:
+    """
+    The context returned by `DependencyCollection.listen_for_dependencies`.
+    A plain class rather than `@contextmanager`, since it is entered on
+    every recompute and a generator-based context costs ~3x as much.
+    """
+    def __init__(self, collection: DependencyCollection):
+        self._collection = collection
+        self._buffer = _DependencyFrame()
+        self._token: Token[_DependencyFrame | None] | None = None
+
+    def __enter__(self) -> None:
+        self._token = _dep_ctx.set(self._buffer)
+
+    def __exit__(self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> bool:
+        assert self._token is not None
+        _dep_ctx.reset(self._token)
+        self._collection._update_dependencies(self._buffer, exc_type is None)
+        return False
+
+
 @contextmanager
 def dependency_collection(handler: _SimpleHandler) -> Iterator[DependencyCollection]:
     """
@@ -70,7 +191,9 @@ def dependency_collection(handler: _SimpleHandler) -> Iterator[DependencyCollect
     try:
         yield deps
     finally:
-        assert deps # Keep alive
+        # Release all bindings as soon as the context closes
+        # (e.g. a watcher is cancelled), rather than whenever GC runs.
+        deps.dispose()
 
 
 def announce_dependency(
@@ -79,10 +202,11 @@ def announce_dependency(
     """
     Announces a dependency to anyone listening.
     """
-    if _dep_ctx_stack:
+    frame = _dep_ctx.get()
+    if frame is not None:
         if callable(notifier):
             notifier = notifier()
-        _dep_ctx_stack[-1].add(notifier)
+        frame[notifier] = None
 
 
 async def watchf(
@@ -125,13 +249,30 @@ async def watchf(
         ...     print(f"Value changed to: {value}")
 
     """
-    changed = Event() # An event that is set when a dependency changes
-    with dependency_collection(lambda _: changed.set()) as deps:
+    dirty = False # Set when a dependency changes
+    waiter: Future[None] | None = None # One-shot, only while suspended
+
+    def on_change(_: None) -> None:
+        # Coalesce: only the first change per round needs to wake us;
+        # the re-evaluation will read the latest state anyway.
+        nonlocal dirty
+        if dirty:
+            return
+        dirty = True
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    with dependency_collection(on_change) as deps:
         while True:
             # Get value (listening for dependencies)
             with deps.listen_for_dependencies():
                 value = f()
             yield value
-            await changed.wait()
+            if not dirty:
+                waiter = get_running_loop().create_future()
+                try:
+                    await waiter
+                finally:
+                    waiter = None
             await sleep(0)
-            changed.clear()
+            dirty = False
@@ -1,4 +1,6 @@
-from typing import MutableSequence, TypeVar, overload, Iterable
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import Generic, MutableSequence, TypeVar, overload, Iterable
 
 from .notifier import Notifier, PChangeNotifier
 
@@ -14,11 +16,27 @@ class ReactiveList(MutableSequence[_TValue], PChangeNotifier):
     def __init__(self, values: Iterable[_TValue] | None = None):
         self._notifier = Notifier[None]()
         self._values: list[_TValue] = list(values or [])
+        self._batch_depth = 0
+        self._batch_dirty = False
 
     @property
     def on_change(self) -> Notifier[None]:
         return self._notifier
 
+    def batch(self) -> AbstractContextManager[None]:
+        """
+        Defers change notifications for the duration of the context;
+        `on_change` fires once when the outermost batch exits,
+        and only if the list was changed.
+        """
+        return _Batch(self)
+
+    def _notify(self) -> None:
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._notifier.fire(None)
+
     @overload
     def __getitem__(self, index: int) -> _TValue:
         ...
@@ -49,7 +67,7 @@ class ReactiveList(MutableSequence[_TValue], PChangeNotifier):
             if not isinstance(value, Iterable):
                 raise TypeError("Can only assign an iterable to a slice.")
             self._values[index] = value # type: ignore
-        self._notifier.fire(None)
+        self._notify()
 
     @overload
     def __delitem__(self, index: int) -> None:
@@ -61,43 +79,66 @@ class ReactiveList(MutableSequence[_TValue], PChangeNotifier):
 
     def __delitem__(self, index: int | slice) -> None:
         del self._values[index]
-        self._notifier.fire(None)
+        self._notify()
 
     def __len__(self) -> int:
         return len(self._values)
 
     def insert(self, index: int, value: _TValue) -> None:
         self._values.insert(index, value)
-        self._notifier.fire(None)
+        self._notify()
 
     def append(self, value: _TValue) -> None:
         self._values.append(value)
-        self._notifier.fire(None)
+        self._notify()
 
     def clear(self) -> None:
         self._values.clear()
-        self._notifier.fire(None)
+        self._notify()
 
     def extend(self, values: Iterable[_TValue]) -> None:
         self._values.extend(values)
-        self._notifier.fire(None)
+        self._notify()
 
     def pop(self, index: int = -1) -> _TValue:
         value = self._values.pop(index)
-        self._notifier.fire(None)
+        self._notify()
         return value
 
     def remove(self, value: _TValue) -> None:
         self._values.remove(value)
-        self._notifier.fire(None)
+        self._notify()
 
     def reverse(self) -> None:
         self._values.reverse()
-        self._notifier.fire(None)
+        self._notify()
 
     def __str__(self) -> str:
         return str(self._values)
 
     def __repr__(self) -> str:
         return repr(self._values)
-    
+
+
+class _Batch(Generic[_TValue]):
+    """
+    The context returned by `ReactiveList.batch`.
+    The nesting depth lives on the list, so batches may nest.
+    """
+    def __init__(self, values: ReactiveList[_TValue]):
+        self._values = values
+
+    def __enter__(self) -> None:
+        self._values._batch_depth += 1
+
+    def __exit__(self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> bool:
+        values = self._values
+        values._batch_depth -= 1
+        if not values._batch_depth and values._batch_dirty:
+            values._batch_dirty = False
+            values._notifier.fire(None)
+        return False
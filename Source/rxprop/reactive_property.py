@@ -1,7 +1,8 @@
-from typing import Any, Callable
-from weakref import WeakKeyDictionary
+from typing import Any, Callable, TypeGuard
+from weakref import ref as weak_ref
 
-from .reactive import announce_dependency
+from .instance_dict import InstanceDict
+from .reactive import _dep_ctx, announce_dependency
 from .notifier import Notifier, PChangeNotifier
 from .typed_property import Getter, TypedProperty, TClass, TValue
 
@@ -9,6 +10,19 @@ from .typed_property import Getter, TypedProperty, TClass, TValue
 _SimpleNotifier = Notifier[None]
 _SimpleHandler = Callable[[None], None]
 
+# Exact built-in types, whose instances can never grow an `on_change`.
+# Checked first, since `isinstance` against a runtime Protocol is slow.
+_PLAIN_TYPES = frozenset[type]((
+    type(None), bool, int, float, complex, str, bytes,
+    tuple, list, dict, set, frozenset,
+))
+
+
+def _is_change_notifier(value: Any) -> TypeGuard[PChangeNotifier]:
+    """ Returns True if `value` implements `PChangeNotifier`. """
+    return type(value) not in _PLAIN_TYPES \
+        and isinstance(value, PChangeNotifier)
+
 
 class ReactivePropertyMixin(TypedProperty[TClass, TValue]):
     """
@@ -18,8 +32,8 @@ class ReactivePropertyMixin(TypedProperty[TClass, TValue]):
     """
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
-        self._notifiers = WeakKeyDictionary[TClass, _SimpleNotifier]()
-        self._triggers = WeakKeyDictionary[TClass, _SimpleHandler]()
+        self._notifiers = InstanceDict[TClass, _SimpleNotifier]()
+        self._triggers = InstanceDict[TClass, _SimpleHandler]()
 
     def _get_notifier(self, instance: Any) -> _SimpleNotifier:
         """
@@ -27,29 +41,54 @@ class ReactivePropertyMixin(TypedProperty[TClass, TValue]):
         If the notifier is not in the stash, a new notifier is created
         and added to the stash.
         """
-        if not instance in self._notifiers:
-            self._notifiers[instance] = _SimpleNotifier()
-        return self._notifiers[instance]
+        try:
+            return self._notifiers[instance]
+        except KeyError:
+            notifier = self._notifiers[instance] = _SimpleNotifier()
+            return notifier
 
     def _get_notifier_trigger(self, instance: Any) -> _SimpleHandler:
         """
         Returns `_fire_notifier` as a handler.
         """
-        if not instance in self._triggers:
-            self._triggers[instance] = lambda _: self._fire_notifier(instance)
-        return self._triggers[instance]
+        try:
+            return self._triggers[instance]
+        except KeyError:
+            # Refer to the instance weakly, so the stashed trigger
+            # doesn't keep its own key (the instance) alive.
+            instance_ref = weak_ref(instance)
+            def trigger(_: None) -> None:
+                if (instance := instance_ref()) is not None:
+                    self._fire_notifier(instance)
+            self._triggers[instance] = trigger
+            return trigger
+
+    def _announce(self, instance: Any, value: Any = None) -> None:
+        """
+        Announces the notifier for the given instance as a dependency,
+        along with `value`'s own change notifier, if it has one.
+        Does nothing (and creates no notifier) if nobody is listening.
+        """
+        frame = _dep_ctx.get()
+        if frame is None:
+            return
+        frame[self._get_notifier(instance)] = None
+        if _is_change_notifier(value):
+            frame[value.on_change] = None
 
     def _fire_notifier(self, instance: Any) -> None:
         """
         Fires the notifier for the given instance.
+        Does nothing (and creates no notifier) if it was never observed.
         """
-        notifier = self._get_notifier(instance)
-        notifier.fire(None)
+        notifier = self._notifiers.get(instance)
+        if notifier is not None:
+            notifier.fire(None)
 
     def _get(self, instance: Any) -> TValue:
-        announce_dependency(self._get_notifier(instance))
+        self._announce(instance) # Up front, so failed reads are tracked too
         value = super()._get(instance)
-        if isinstance(value, PChangeNotifier):
+        if _is_change_notifier(value):
             announce_dependency(value.on_change)
         return value
 
@@ -1,19 +1,22 @@
 
+import gc
 import unittest
-from unittest.mock import Mock
-from .reactive_property import rxproperty
-from .computed_property import rxcomputed
+import weakref
+from .value_property import rxvalue
+from .computed_property import ComputedProperty, rxcomputed
+from .reactive_list import ReactiveList
 
 class TestComputedProperty(unittest.TestCase):
 
     def test_basic_computation(self):
         class MyObject:
-            def __init__(self):
-                self.a = rxproperty(1)
+            @rxvalue
+            def a(self) -> int:
+                return 1
 
             @rxcomputed
             def b(self) -> int:
-                return self.a.get() + 1
+                return self.a + 1
 
         obj = MyObject()
         self.assertEqual(obj.b, 2)
@@ -21,47 +24,71 @@ class TestComputedProperty(unittest.TestCase):
     def test_caching(self):
         class MyObject:
             def __init__(self):
-                self.a = rxproperty(1)
-                self.b_compute_count = Mock()
+                self.b_compute_count = 0
+
+            @rxvalue
+            def a(self) -> int:
+                return 1
 
             @rxcomputed
             def b(self) -> int:
-                self.b_compute_count()
-                return self.a.get() + 1
+                self.b_compute_count += 1
+                return self.a + 1
 
         obj = MyObject()
         self.assertEqual(obj.b, 2)
         self.assertEqual(obj.b, 2)
-        self.assertEqual(obj.b_compute_count.call_count, 1)
+        self.assertEqual(obj.b_compute_count, 1)
+
+    def test_cached_value_identity(self):
+        class MyObject:
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+            @rxcomputed
+            def b(self) -> list[int]:
+                return [self.a] * 2
+
+        obj = MyObject()
+        # No change in between, so the very same result is served
+        self.assertIs(obj.b, obj.b)
+
+        obj.a = 2
+        self.assertEqual(obj.b, [2, 2])
 
     def test_recomputation(self):
         class MyObject:
             def __init__(self):
-                self.a = rxproperty(1)
-                self.b_compute_count = Mock()
+                self.b_compute_count = 0
+
+            @rxvalue
+            def a(self) -> int:
+                return 1
 
             @rxcomputed
             def b(self) -> int:
-                self.b_compute_count()
-                return self.a.get() + 1
+                self.b_compute_count += 1
+                return self.a + 1
 
         obj = MyObject()
         self.assertEqual(obj.b, 2)
-        self.assertEqual(obj.b_compute_count.call_count, 1)
+        self.assertEqual(obj.b_compute_count, 1)
 
-        obj.a.set(5)
+        obj.a = 5
         self.assertEqual(obj.b, 6)
-        self.assertEqual(obj.b_compute_count.call_count, 2)
+        self.assertEqual(obj.b_compute_count, 2)
 
     def test_property_chain(self):
         class MyObject:
-            def __init__(self):
-                self.a = rxproperty(1)
+            @rxvalue
+            def a(self) -> int:
+                return 1
 
             @rxcomputed
             def b(self) -> int:
-                return self.a.get() + 1
-            
+                return self.a + 1
+
             @rxcomputed
             def c(self) -> int:
                 return self.b * 2
@@ -69,8 +96,202 @@ class TestComputedProperty(unittest.TestCase):
         obj = MyObject()
         self.assertEqual(obj.c, 4)
 
-        obj.a.set(2)
+        obj.a = 2
         self.assertEqual(obj.c, 6)
 
+    def test_early_cutoff(self):
+        class MyObject:
+            def __init__(self):
+                self.c_compute_count = 0
+
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+            @rxcomputed
+            def parity(self) -> int:
+                return self.a % 2
+
+            @rxcomputed
+            def c(self) -> int:
+                self.c_compute_count += 1
+                return self.parity * 10
+
+        obj = MyObject()
+        self.assertEqual(obj.c, 10)
+
+        obj.a = 3 # parity unchanged; c should not be invalidated
+        self.assertEqual(obj.c, 10)
+        self.assertEqual(obj.c_compute_count, 1)
+
+        obj.a = 4
+        self.assertEqual(obj.c, 0)
+        self.assertEqual(obj.c_compute_count, 2)
+
+    def test_cutoff_sees_in_place_changes(self):
+        class MyObject:
+            @rxvalue
+            def items(self) -> ReactiveList[int]:
+                return ReactiveList([1])
+
+            @rxcomputed
+            def visible(self) -> ReactiveList[int]:
+                return self.items # The same list, every time
+
+            @rxcomputed
+            def count(self) -> int:
+                return len(self.visible)
+
+        obj = MyObject()
+        self.assertEqual(obj.count, 1)
+        obj.items.append(2)
+        self.assertEqual(obj.count, 2)
+        obj.items.append(3)
+        self.assertEqual(obj.count, 3)
+
+    def test_cutoff_sees_in_place_snapshot_changes(self):
+        class MyObject:
+            def __init__(self):
+                self.store = dict[str, int]()
+
+            @rxvalue
+            def version(self) -> int:
+                return 0
+
+            @rxcomputed
+            def snapshot(self) -> dict[str, int]:
+                _ = self.version
+                return self.store # Updated in place, then version bumped
+
+            @rxcomputed
+            def keys(self) -> list[str]:
+                return sorted(self.snapshot)
+
+        obj = MyObject()
+        self.assertEqual(obj.keys, [])
+        obj.store['a'] = 1
+        obj.version += 1
+        self.assertEqual(obj.keys, ['a'])
+
+    def test_cutoff_releases_values_read(self):
+        class Payload:
+            pass
+
+        class MyObject:
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+            @rxcomputed
+            def b(self) -> Payload:
+                _ = self.a
+                return Payload()
+
+            @rxcomputed
+            def c(self) -> int:
+                _ = self.b # Kept for the cutoff, but only while obj lives
+                return 1
+
+        obj = MyObject()
+        self.assertEqual(obj.c, 1)
+        payload_ref = weakref.ref(obj.b)
+
+        del obj
+        gc.collect()
+        self.assertIsNone(payload_ref())
+
+    def test_writes_do_not_recompute(self):
+        class MyObject:
+            def __init__(self):
+                self.b_compute_count = 0
+
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+            @rxcomputed
+            def b(self) -> int:
+                self.b_compute_count += 1
+                return self.a + 1
+
+            @rxcomputed
+            def c(self) -> int:
+                return self.b * 2
+
+        obj = MyObject()
+        self.assertEqual(obj.c, 4)
+
+        # c depends on b, but nobody reads either until the writes are done
+        for i in range(100):
+            obj.a = i + 2
+        self.assertEqual(obj.b_compute_count, 1)
+
+        self.assertEqual(obj.c, 204)
+        self.assertEqual(obj.b_compute_count, 2)
+
+    def test_getter_error_reaches_reader(self):
+        class MyObject:
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+            @rxcomputed
+            def b(self) -> int:
+                if self.a < 0:
+                    raise ValueError("a is negative")
+                return self.a
+
+            @rxcomputed
+            def c(self) -> int:
+                return self.b
+
+        obj = MyObject()
+        self.assertEqual(obj.c, 1)
+
+        obj.a = -1 # The setter must not run (or swallow) the getters
+        with self.assertRaises(ValueError):
+            _ = obj.c
+
+        obj.a = 2
+        self.assertEqual(obj.c, 2)
+
+    def test_failed_read_is_tracked(self):
+        class MyObject:
+            @rxvalue
+            def a(self) -> int:
+                return -1
+
+            @rxcomputed
+            def b(self) -> int:
+                if self.a < 0:
+                    raise ValueError("a is negative")
+                return self.a
+
+            @rxcomputed
+            def c(self) -> str:
+                try:
+                    return str(self.b)
+                except ValueError:
+                    return 'err'
+
+        obj = MyObject()
+        self.assertEqual(obj.c, 'err')
+
+        obj.a = 2 # b recovers; c must have tracked it regardless
+        self.assertEqual(obj.c, '2')
+
+    def test_get_override_is_honoured(self):
+        class UpperProperty(ComputedProperty[object, str]):
+            def _get(self, instance: object) -> str:
+                return super()._get(instance).upper()
+
+        class MyObject:
+            name = UpperProperty(fget=lambda self: 'abc')
+
+        obj = MyObject()
+        # Cache hits are served from `__get__`, but never past `_get`
+        self.assertEqual([obj.name, obj.name, obj.name], ['ABC'] * 3)
+        self.assertEqual(obj.name, type(obj).name.get(obj))
+
 if __name__ == '__main__':
     unittest.main()
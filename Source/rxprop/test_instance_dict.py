@@ -0,0 +1,78 @@
+
+import gc
+import unittest
+import weakref
+from .instance_dict import InstanceDict, _tables_by_key
+
+class Key:
+    pass
+
+class EqualKey:
+    def __eq__(self, other):
+        return isinstance(other, EqualKey)
+
+class TestInstanceDict(unittest.TestCase):
+
+    def test_set_and_get(self):
+        d = InstanceDict[Key, int]()
+        key = Key()
+        d[key] = 42
+        self.assertIn(key, d)
+        self.assertEqual(d[key], 42)
+        self.assertEqual(d.get(key), 42)
+
+    def test_identity_keys(self):
+        d = InstanceDict[EqualKey, int]()
+        key1, key2 = EqualKey(), EqualKey()
+        d[key1] = 1
+        d[key2] = 2
+        self.assertEqual(d[key1], 1)
+        self.assertEqual(d[key2], 2)
+
+    def test_entry_released_on_collect(self):
+        d = InstanceDict[Key, int]()
+        key = Key()
+        d[key] = 42
+        del key
+        gc.collect()
+        self.assertEqual(len(d), 0)
+
+    def test_one_finalizer_per_key(self):
+        d1 = InstanceDict[Key, int]()
+        d2 = InstanceDict[Key, int]()
+        key = Key()
+        d1[key] = 1
+        d2[key] = 2
+        self.assertEqual(len(_tables_by_key[id(key)]), 2)
+        self.assertEqual(len(weakref.getweakrefs(key)), 1)
+
+        key_id = id(key)
+        del key
+        gc.collect()
+        self.assertEqual((len(d1), len(d2)), (0, 0))
+        self.assertNotIn(key_id, _tables_by_key)
+
+    def test_reset_after_delete(self):
+        d = InstanceDict[Key, int]()
+        key = Key()
+        d[key] = 1
+        del d[key]
+        self.assertNotIn(key, d)
+        d[key] = 2
+        self.assertEqual(d[key], 2)
+        self.assertEqual(_tables_by_key[id(key)], [d])
+
+    def test_lazy_allocation(self):
+        d1 = InstanceDict[Key, int]()
+        d2 = InstanceDict[Key, int]()
+        key = Key()
+        self.assertIsNone(d1.get(key))
+        self.assertEqual(d1.pop(key, 0), 0)
+
+        d1[key] = 1
+        self.assertNotIn(key, d2) # Writes never leak into other tables
+        self.assertEqual(len(d2), 0)
+        self.assertEqual(_tables_by_key[id(key)], [d1])
+
+if __name__ == '__main__':
+    unittest.main()
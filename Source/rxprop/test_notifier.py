@@ -1,37 +1,60 @@
 
+import gc
 import unittest
-from unittest.mock import Mock
 from .notifier import Notifier, ChangeNotifierBase
 
+class Recorder:
+    """ A minimal handler that records the arguments it is fired with. """
+    def __init__(self):
+        self.calls = list[object]()
+
+    def __call__(self, args: object) -> None:
+        self.calls.append(args)
+
 class TestNotifier(unittest.TestCase):
 
     def test_bind_and_fire(self):
         notifier = Notifier[int]()
-        handler = Mock()
+        handler = Recorder()
         
         lt = notifier.bind(handler)
         
         notifier.fire(42)
-        handler.assert_called_once_with(42)
+        self.assertEqual(handler.calls, [42])
 
     def test_unbind(self):
         notifier = Notifier[int]()
-        handler = Mock()
+        handler = Recorder()
         
         lt = notifier.bind(handler)
         lt.dispose()
 
         notifier.fire(42)
-        handler.assert_not_called()
+        self.assertEqual(handler.calls, [])
+
+    def test_unbind_on_release(self):
+        notifier = Notifier[int]()
+        handler = Recorder()
+
+        notifier.bind(handler) # Lifetime dropped immediately
+        gc.collect()
+
+        notifier.fire(42)
+        self.assertEqual(handler.calls, [])
+        self.assertFalse(notifier.has_bindings())
+
+    def test_notifier_has_no_instance_dict(self):
+        notifier = Notifier[int]()
+        self.assertFalse(hasattr(notifier, '__dict__'))
 
     def test_change_notifier_base(self):
         change_notifier = ChangeNotifierBase()
-        handler = Mock()
+        handler = Recorder()
 
         lt = change_notifier.on_change.bind(handler)
         change_notifier.on_change.fire(None)
 
-        handler.assert_called_once_with(None)
+        self.assertEqual(handler.calls, [None])
 
 if __name__ == '__main__':
     unittest.main()
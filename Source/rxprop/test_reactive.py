@@ -1,6 +1,9 @@
 
 import unittest
 import asyncio
+import gc
+import threading
+import weakref
 from unittest.mock import Mock
 from .reactive import DependencyCollection, announce_dependency, watchf
 from .notifier import Notifier
@@ -35,6 +38,137 @@ class TestReactive(unittest.TestCase):
         notifier2.fire(None)
         handler.assert_called_once()
 
+    def test_listen_for_dependencies_dedupes(self):
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        notifier = Notifier[None]()
+
+        with collection.listen_for_dependencies():
+            announce_dependency(notifier)
+            announce_dependency(notifier)
+
+        notifier.fire(None)
+        handler.assert_called_once()
+
+    def test_listen_for_dependencies_same_trace(self):
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        notifier = Notifier[None]()
+
+        with collection.listen_for_dependencies():
+            announce_dependency(notifier)
+        binding = collection._bindings[notifier]
+
+        # Re-running with an identical trace keeps the existing binding
+        with collection.listen_for_dependencies():
+            announce_dependency(notifier)
+        self.assertIs(collection._bindings[notifier], binding)
+
+        notifier.fire(None)
+        handler.assert_called_once()
+
+    def test_listen_for_dependencies_nested(self):
+        outer_handler = Mock()
+        inner_handler = Mock()
+        outer = DependencyCollection(outer_handler)
+        inner = DependencyCollection(inner_handler)
+        notifier1 = Notifier[None]()
+        notifier2 = Notifier[None]()
+        notifier3 = Notifier[None]()
+
+        with outer.listen_for_dependencies():
+            announce_dependency(notifier1)
+            with inner.listen_for_dependencies():
+                announce_dependency(notifier2)
+            announce_dependency(notifier3) # Back in the outer frame
+
+        self.assertEqual(outer._dependencies,
+            (weakref.ref(notifier1), weakref.ref(notifier3)))
+        self.assertEqual(inner._dependencies, (weakref.ref(notifier2),))
+
+    def test_listen_for_dependencies_releases_dropped_notifiers(self):
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        notifier1 = Notifier[None]()
+        notifier2 = Notifier[None]()
+
+        with collection.listen_for_dependencies():
+            announce_dependency(notifier1)
+        notifier1_ref = weakref.ref(notifier1)
+        del notifier1
+        gc.collect()
+        self.assertIsNone(notifier1_ref())
+
+        with collection.listen_for_dependencies():
+            announce_dependency(notifier2)
+        notifier2.fire(None)
+        handler.assert_called_once()
+
+    def test_listen_for_dependencies_after_exception(self):
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        notifier1 = Notifier[None]()
+        notifier2 = Notifier[None]()
+
+        with self.assertRaises(RuntimeError):
+            with collection.listen_for_dependencies():
+                announce_dependency(notifier1)
+                raise RuntimeError()
+
+        notifier1.fire(None)
+        handler.assert_called_once()
+
+        with collection.listen_for_dependencies():
+            announce_dependency(notifier2)
+
+        notifier1.fire(None)
+        handler.assert_called_once()
+        notifier2.fire(None)
+        self.assertEqual(handler.call_count, 2)
+
+    def test_listen_for_dependencies_is_thread_local(self):
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        notifier1 = Notifier[None]()
+        notifier2 = Notifier[None]()
+
+        with collection.listen_for_dependencies():
+            announce_dependency(notifier1)
+            # A read on another thread must not be tracked here
+            thread = threading.Thread(target=announce_dependency, args=(notifier2,))
+            thread.start()
+            thread.join()
+
+        notifier2.fire(None)
+        handler.assert_not_called()
+        notifier1.fire(None)
+        handler.assert_called_once()
+
+    def test_listen_for_dependencies_is_task_local(self):
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        notifier1 = Notifier[None]()
+        notifier2 = Notifier[None]()
+
+        async def test_async():
+            go = asyncio.Event()
+            async def other_task():
+                await go.wait()
+                announce_dependency(notifier2)
+            task = asyncio.create_task(other_task())
+
+            with collection.listen_for_dependencies():
+                # Another task runs while we are suspended mid-listen;
+                # its reads must not land in our frame.
+                go.set()
+                await asyncio.sleep(0)
+                self.assertTrue(task.done())
+                announce_dependency(notifier1)
+            await task
+
+        asyncio.run(test_async())
+        self.assertEqual(collection._dependencies, (weakref.ref(notifier1),))
+
     def test_watchf(self):
         
         class MyObject:
@@ -68,8 +202,78 @@ class TestReactive(unittest.TestCase):
         
         asyncio.run(test_async())
 
+    def test_watchf_change_while_consuming(self):
+        notifier = Notifier[None]()
+        state = {'a': 1}
+
+        def get_a():
+            announce_dependency(notifier)
+            return state['a']
+
+        async def test_async():
+            results = []
+            async for value in watchf(get_a):
+                results.append(value)
+                if len(results) == 2:
+                    break
+                # Change before the watcher suspends; must not be lost
+                state['a'] = 2
+                notifier.fire(None)
+
+            self.assertEqual(results, [1, 2])
+
+        asyncio.run(test_async())
+
+    def test_watchf_coalesces_burst(self):
+        notifier = Notifier[None]()
+        state = {'a': 1}
+        evaluations = Mock()
+
+        def get_a():
+            evaluations()
+            announce_dependency(notifier)
+            return state['a']
+
+        async def test_async():
+            results = []
+            async def consume():
+                async for value in watchf(get_a):
+                    results.append(value)
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0)
+            for i in (2, 3, 4):
+                state['a'] = i
+                notifier.fire(None)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+            self.assertEqual(results, [1, 4])
+            self.assertEqual(evaluations.call_count, 2)
+
+        asyncio.run(test_async())
+
+    def test_watchf_releases_bindings_on_cancel(self):
+        notifier = Notifier[None]()
+
+        def get_a():
+            announce_dependency(notifier)
+            return 1
+
+        async def test_async():
+            async def consume():
+                async for _ in watchf(get_a):
+                    pass
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0)
+            self.assertTrue(notifier.has_bindings())
+            task.cancel()
+            await asyncio.sleep(0)
+            self.assertFalse(notifier.has_bindings())
+
+        asyncio.run(test_async())
+
     async def change_value(self, obj):
-        await asyncio.sleep(0.01) # allow the watcher to suspend
+        await asyncio.sleep(0) # a single yield; no timer needed
         obj.a = 2
 
 if __name__ == '__main__':
@@ -55,5 +55,28 @@ class TestReactiveList(unittest.TestCase):
         self.assertEqual(self.list[0], 3)
         self.handler.assert_called_once()
 
+    def test_batch(self):
+        handler = Mock()
+        lt = self.list.on_change.bind(handler)
+
+        with self.list.batch():
+            self.list.append(4)
+            with self.list.batch():
+                self.list.append(5)
+            self.list.remove(1)
+            handler.assert_not_called()
+
+        self.assertEqual(list(self.list), [2, 3, 4, 5])
+        handler.assert_called_once()
+
+    def test_batch_without_changes(self):
+        handler = Mock()
+        lt = self.list.on_change.bind(handler)
+
+        with self.list.batch():
+            pass
+
+        handler.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
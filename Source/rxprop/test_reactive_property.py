@@ -1,9 +1,14 @@
 
+import gc
 import unittest
+import weakref
 from unittest.mock import Mock
 from .reactive_property import ReactivePropertyMixin
 from .reactive import DependencyCollection
 from .notifier import Notifier
+from .value_property import rxvalue
+from .computed_property import rxcomputed
+from .reactive_list import ReactiveList
 
 class TestReactiveProperty(unittest.TestCase):
 
@@ -45,6 +50,47 @@ class TestReactiveProperty(unittest.TestCase):
         obj.a = 42
         handler.assert_called_once()
 
+    def test_notifier_is_interned(self):
+        class MyObject:
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+        obj1 = MyObject()
+        obj2 = MyObject()
+        obj1.a = 42
+        prop = MyObject.a
+
+        # One notifier per (property, instance), reused across reads,
+        # so repeated reads collapse to a single tracked dependency.
+        self.assertIs(prop._get_notifier(obj1), prop._get_notifier(obj1))
+        self.assertIsNot(prop._get_notifier(obj1), prop._get_notifier(obj2))
+
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        with collection.listen_for_dependencies():
+            self.assertEqual(obj1.a, 42)
+            self.assertEqual(obj1.a, 42)
+        self.assertEqual(collection._dependencies,
+            (weakref.ref(prop._get_notifier(obj1)),))
+
+    def test_failed_read_is_tracked(self):
+        class MyProperty(ReactivePropertyMixin[object, int]):
+            pass
+
+        class MyObject:
+            a = MyProperty()
+
+        obj = MyObject()
+
+        handler = Mock()
+        collection = DependencyCollection(handler)
+        with collection.listen_for_dependencies():
+            with self.assertRaises(AttributeError):
+                _ = obj.a # No value; the read is still tracked
+        self.assertEqual(collection._dependencies,
+            (weakref.ref(MyObject.a._get_notifier(obj)),))
+
     def test_change_notifier_value(self):
         class MyProperty(ReactivePropertyMixin[object, Notifier]):
             pass
@@ -66,5 +112,73 @@ class TestReactiveProperty(unittest.TestCase):
         handler.assert_called_once()
 
 
+    def test_get_announces_change_notifier_value(self):
+        class MyObject:
+            @rxvalue
+            def items(self) -> ReactiveList[int]:
+                return ReactiveList([1])
+
+        obj = MyObject()
+        handler = Mock()
+        collection = DependencyCollection(handler)
+
+        with collection.listen_for_dependencies():
+            _ = obj.items
+            _ = obj.items # Second read is served from the stored value
+
+        obj.items.append(2)
+        handler.assert_called_once()
+
+    def test_write_creates_no_notifier(self):
+        class MyObject:
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+            @rxcomputed
+            def b(self) -> int:
+                return self.a + 1
+
+        obj1 = MyObject()
+        obj2 = MyObject()
+        self.assertEqual(obj1.b, 2) # b observes obj1.a; nobody observes b
+
+        # Only observed instances get a notifier, writes included
+        obj1.a = 2
+        obj2.a = 2
+        self.assertEqual(len(MyObject.a._notifiers), 1)
+        self.assertEqual(len(MyObject.b._notifiers), 0)
+        self.assertEqual(obj1.b, 3)
+
+    def test_instance_released(self):
+        class MyObject:
+            @rxvalue
+            def a(self) -> int:
+                return 1
+
+            @rxcomputed
+            def b(self) -> int:
+                return self.a + 1
+
+        obj = MyObject()
+        self.assertEqual(obj.b, 2)
+        obj_ref = weakref.ref(obj)
+        deps = MyObject.b._computed_dependencies[obj]
+        deps_ref = weakref.ref(deps)
+        binding_refs = [weakref.ref(b) for b in deps._bindings.values()]
+        self.assertEqual(len(binding_refs), 1)
+        del deps
+
+        # Stashed notifiers/triggers must not keep the instance alive,
+        # and whatever was stashed for it goes with it.
+        del obj
+        gc.collect()
+        self.assertIsNone(obj_ref())
+        self.assertEqual(len(MyObject.a._notifiers), 0)
+        self.assertEqual(len(MyObject.b._triggers), 0)
+        self.assertEqual(len(MyObject.b._computed_dependencies), 0)
+        self.assertIsNone(deps_ref())
+        self.assertEqual([ref() for ref in binding_refs], [None])
+
 if __name__ == '__main__':
     unittest.main()
@@ -57,8 +57,18 @@ class TestWatch(unittest.TestCase):
         
         asyncio.run(test_async())
 
+    def test_watchp_invalid_name_fails_on_call(self):
+        class MyObject:
+            pass
+
+        obj = MyObject()
+
+        # Names are resolved by watchp itself, before any iteration
+        with self.assertRaises(ValueError):
+            watchp(obj, 'a')
+
     async def change_value(self, obj):
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0) # a single yield; no timer needed
         obj.a = 2
 
 if __name__ == '__main__':
@@ -11,6 +11,8 @@ Getter = Callable[[TClass], TValue]
 Setter = Callable[[TClass, TValue], None]
 Deleter = Callable[[TClass], None]
 
+_UNSET: Any = object() # Sentinel for "no value stored"
+
 
 class TypedProperty(Generic[TClass, TValue]):
     """
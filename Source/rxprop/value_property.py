@@ -1,8 +1,10 @@
-from typing import Any
-from weakref import WeakKeyDictionary
+from typing import Any, overload, Self
 
+from .instance_dict import InstanceDict
 from .reactive_property import ReactivePropertyMixin
-from .typed_property import DefaultMixin, Getter, TClass, TValue, TypedProperty
+from .typed_property import (
+    _UNSET, DefaultMixin, Getter, TClass, TValue, TypedProperty
+)
 
 
 class ValueProperty(
@@ -14,11 +16,13 @@ class ValueProperty(
     """
     def __init__(self, **kwargs: Any):
         super().__init__(**kwargs)
-        self._values = WeakKeyDictionary[TClass, TValue]()
+        self._values = InstanceDict[TClass, TValue]()
 
     def _get(self, instance: Any) -> TValue:
-        if instance in self._values:
-            return self._values[instance]
+        # Single lookup; absence from the stash means "unset"
+        value = self._values.get(instance, _UNSET)
+        if value is not _UNSET:
+            return value
         value = super()._get(instance)
         self._values[instance] = value
         return value
@@ -34,6 +38,40 @@ class ReactiveValueProperty(
     """
     A reactive property backed by a field.
     """
+    def __init__(self, **kwargs: Any):
+        super().__init__(**kwargs)
+        # The read path in `__get__` stands in for our own `_get` only;
+        # if a subclass overrides `_get`, reads go through it instead.
+        self._get_is_own = type(self)._get is ReactiveValueProperty._get
+
+    @overload
+    def __get__(self,
+        instance: None,
+        owner: type[TClass] | None = None
+    ) -> Self: ...
+
+    @overload
+    def __get__(self,
+        instance: Any,
+        owner: type[TClass] | None = None
+    ) -> TValue: ...
+
+    def __get__(self,
+        instance: TClass | None,
+        owner: type[TClass] | None = None
+    ) -> TValue | Self:
+        # Specialised read path: serve stored values directly,
+        # saving the `_get` chain through both mixins.
+        if instance is None:
+            return self
+        if not self._get_is_own:
+            return self._get(instance)
+        value = self._values.get(instance, _UNSET)
+        if value is _UNSET:
+            return self._get(instance)
+        self._announce(instance, value)
+        return value
+
     def _set(self, instance: Any, value: TValue) -> None:
         # Skip updates (and thus notifications) if the value is the same
         old_value = self._get(instance)
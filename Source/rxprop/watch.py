@@ -63,7 +63,7 @@ def watchp(
     
     # Type-weak path
     cls: type = type(instance)
-    prop = getattr(cls, property)
+    prop = getattr(cls, property, None) # Missing names are rejected below
     if not isinstance(prop, ReactivePropertyMixin):
         raise ValueError(f"{property} is not a reactive property")
     return watchf(lambda: prop.get(instance)) # type: ignore